@@ -0,0 +1,48 @@
+"""
+Shared pytest fixtures for the unit and in-process API tests.
+
+Holds the token and breadcrumb every suite hands to the code under test,
+and ``mock_create_token``, which patches the token and breadcrumb helpers
+of a ``src.routes.<prefix>_routes`` module. Tests using it must provide a
+``prefix`` argument, usually through ``pytest.mark.parametrize``.
+"""
+from types import MappingProxyType
+from unittest.mock import DEFAULT, patch
+
+import pytest
+
+# Read-only views: the code under test only reads the token and breadcrumb
+MOCK_TOKEN = MappingProxyType({"user_id": "test_user", "roles": ("admin",)})
+MOCK_BREADCRUMB = MappingProxyType(
+    {
+        "at_time": "2024-01-01T00:00:00Z",
+        "by_user": "test_user",
+        "from_ip": "127.0.0.1",
+        "correlation_id": "test-correlation-id",
+    }
+)
+
+
+@pytest.fixture(scope="session")
+def token():
+    """Token for an authenticated admin user."""
+    return MOCK_TOKEN
+
+
+@pytest.fixture(scope="session")
+def breadcrumb():
+    """Breadcrumb as produced by create_flask_breadcrumb."""
+    return MOCK_BREADCRUMB
+
+
+@pytest.fixture
+def mock_create_token(prefix, token, breadcrumb):
+    """Patch the token and breadcrumb helpers of the route module under test."""
+    with patch.multiple(
+        f"src.routes.{prefix}_routes",
+        create_flask_token=DEFAULT,
+        create_flask_breadcrumb=DEFAULT,
+    ) as mocks:
+        mocks["create_flask_token"].return_value = token
+        mocks["create_flask_breadcrumb"].return_value = breadcrumb
+        yield mocks["create_flask_token"]
\ No newline at end of file
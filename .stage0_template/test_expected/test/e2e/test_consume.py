@@ -11,9 +11,8 @@ To run these tests:
 API runs on port 8387 (same for dev and api).
 """
 import pytest
-import requests
 
-from .e2e_auth import get_auth_token
+pytestmark = pytest.mark.e2e
 
 BASE_URL = "http://localhost:8387"
 
@@ -24,12 +23,9 @@ def _err(response, expected):
     return f"Expected {expected}, got {response.status_code}. Response: {body}"
 
 
-@pytest.mark.e2e
-def test_get_consumes_endpoint():
+def test_get_consumes_endpoint(http, auth_headers):
     """Test GET /api/consume endpoint."""
-    token = get_auth_token()
-    headers = {"Authorization": f"Bearer {token}"}
-    response = requests.get(f"{BASE_URL}/api/consume", headers=headers)
+    response = http.get(f"{BASE_URL}/api/consume", headers=auth_headers)
     assert response.status_code == 200, _err(response, 200)
 
     response_data = response.json()
@@ -41,12 +37,9 @@ def test_get_consumes_endpoint():
     assert isinstance(response_data["items"], list), "Items should be a list"
 
 
-@pytest.mark.e2e
-def test_get_consumes_with_name_filter():
+def test_get_consumes_with_name_filter(http, auth_headers):
     """Test GET /api/consume with name query parameter."""
-    token = get_auth_token()
-    headers = {"Authorization": f"Bearer {token}"}
-    response = requests.get(f"{BASE_URL}/api/consume?name=test", headers=headers)
+    response = http.get(f"{BASE_URL}/api/consume?name=test", headers=auth_headers)
     assert response.status_code == 200, _err(response, 200)
 
     response_data = response.json()
@@ -55,20 +48,16 @@ def test_get_consumes_with_name_filter():
     assert isinstance(response_data["items"], list), "Items should be a list"
 
 
-@pytest.mark.e2e
-def test_get_consume_not_found():
+def test_get_consume_not_found(http, auth_headers):
     """Test GET /api/consume/<id> with non-existent ID."""
-    token = get_auth_token()
-    headers = {"Authorization": f"Bearer {token}"}
-    response = requests.get(
+    response = http.get(
         f"{BASE_URL}/api/consume/000000000000000000000000",
-        headers=headers,
+        headers=auth_headers,
     )
     assert response.status_code == 404, _err(response, 404)
 
 
-@pytest.mark.e2e
-def test_consume_endpoints_require_auth():
+def test_consume_endpoints_require_auth(http):
     """Test that consume endpoints require authentication."""
-    response = requests.get(f"{BASE_URL}/api/consume")
+    response = http.get(f"{BASE_URL}/api/consume")
     assert response.status_code == 401, f"Expected 401, got {response.status_code}"
@@ -11,9 +11,8 @@ To run these tests:
 API runs on port 8387 (same for dev and api).
 """
 import pytest
-import requests
 
-from .e2e_auth import get_auth_token
+pytestmark = pytest.mark.e2e
 
 BASE_URL = "http://localhost:8387"
 
@@ -24,17 +23,14 @@ def _err(response, expected):
     return f"Expected {expected}, got {response.status_code}. Response: {body}"
 
 
-@pytest.mark.e2e
-def test_create_create_endpoint():
+def test_create_create_endpoint(http, auth_headers):
     """Test POST /api/create endpoint and basic retrieval by ID and search."""
-    token = get_auth_token()
-    headers = {"Authorization": f"Bearer {token}"}
     data = {
         "name": "e2e-test-create",
         "description": "E2E test create document",
     }
 
-    response = requests.post(f"{BASE_URL}/api/create", headers=headers, json=data)
+    response = http.post(f"{BASE_URL}/api/create", headers=auth_headers, json=data)
     assert response.status_code == 201, _err(response, 201)
 
     response_data = response.json()
@@ -43,12 +39,15 @@ def test_create_create_endpoint():
     assert "created" in response_data
 
 
-@pytest.mark.e2e
-def test_get_creates_endpoint():
+@pytest.mark.e2e_bulk
+def test_create_bulk_workflow(bulk_batch):
+    """Create and list a batch of create documents over one keep-alive session."""
+    bulk_batch(f"{BASE_URL}/api/create").list_items()
+
+
+def test_get_creates_endpoint(http, auth_headers):
     """Test GET /api/create endpoint."""
-    token = get_auth_token()
-    headers = {"Authorization": f"Bearer {token}"}
-    response = requests.get(f"{BASE_URL}/api/create", headers=headers)
+    response = http.get(f"{BASE_URL}/api/create", headers=auth_headers)
     assert response.status_code == 200, _err(response, 200)
 
     response_data = response.json()
@@ -60,20 +59,16 @@ def test_get_creates_endpoint():
     assert isinstance(response_data["items"], list), "Items should be a list"
 
 
-@pytest.mark.e2e
-def test_get_create_not_found():
+def test_get_create_not_found(http, auth_headers):
     """Test GET /api/create/<id> with non-existent ID."""
-    token = get_auth_token()
-    headers = {"Authorization": f"Bearer {token}"}
-    response = requests.get(
+    response = http.get(
         f"{BASE_URL}/api/create/000000000000000000000000",
-        headers=headers,
+        headers=auth_headers,
     )
     assert response.status_code == 404, _err(response, 404)
 
 
-@pytest.mark.e2e
-def test_create_endpoints_require_auth():
+def test_create_endpoints_require_auth(http):
     """Test that create endpoints require authentication."""
-    response = requests.get(f"{BASE_URL}/api/create")
+    response = http.get(f"{BASE_URL}/api/create")
     assert response.status_code == 401, f"Expected 401, got {response.status_code}"
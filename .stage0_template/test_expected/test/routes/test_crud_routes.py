@@ -0,0 +1,212 @@
+"""
+Unit tests for the data domain routes.
+
+Every data domain blueprint exposes the same route shape, so these tests are
+parametrised over the generated blueprint factories rather than repeated per
+domain. Read tests run against every domain; write tests run against the
+Control and Create domains. The underlying service and the token/breadcrumb
+helpers from api_utils are mocked out.
+"""
+import pytest
+from unittest.mock import patch
+from flask import Flask
+from api_utils.flask_utils.exceptions import HTTPNotFound, HTTPUnauthorized
+from src.routes.control_routes import create_control_routes
+from src.services.control_service import ControlService
+from src.routes.create_routes import create_create_routes
+from src.services.create_service import CreateService
+from src.routes.consume_routes import create_consume_routes
+from src.services.consume_service import ConsumeService
+
+
+# (blueprint factory, url prefix / route module name, service class)
+CRUD_CASES = [
+    (create_control_routes, "control", ControlService),
+    (create_create_routes, "create", CreateService),
+    (create_consume_routes, "consume", ConsumeService),
+]
+
+# Domains that expose POST (Control and Create)
+WRITE_CASES = [
+    (create_control_routes, "control", ControlService),
+    (create_create_routes, "create", CreateService),
+]
+
+crud_cases = pytest.mark.parametrize(
+    "prefix,svc",
+    [(prefix, svc) for _, prefix, svc in CRUD_CASES],
+    ids=[case[1] for case in CRUD_CASES],
+)
+write_cases = pytest.mark.parametrize(
+    "prefix,svc",
+    [(prefix, svc) for _, prefix, svc in WRITE_CASES],
+    ids=[case[1] for case in WRITE_CASES],
+)
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Build one Flask test client with every domain blueprint registered."""
+    app = Flask(__name__)
+    for factory, prefix, _ in CRUD_CASES:
+        app.register_blueprint(factory(), url_prefix=f"/api/{prefix}")
+    return app.test_client()
+
+
+@write_cases
+@pytest.mark.usefixtures("mock_create_token")
+def test_create_success(client, prefix, svc, token, breadcrumb):
+    """Test POST /api/<domain> for successful creation."""
+    with (
+        patch.object(svc, f"create_{prefix}") as mock_create,
+        patch.object(svc, f"get_{prefix}") as mock_get,
+    ):
+        mock_create.return_value = "123"
+        mock_get.return_value = {
+            "_id": "123",
+            "name": f"test-{prefix}",
+            "status": "active",
+        }
+
+        response = client.post(
+            f"/api/{prefix}",
+            json={"name": f"test-{prefix}", "status": "active"},
+        )
+
+    assert response.status_code == 201
+    assert response.json["_id"] == "123"
+    mock_create.assert_called_once()
+    mock_get.assert_called_once_with("123", token, breadcrumb)
+
+
+@crud_cases
+@pytest.mark.usefixtures("mock_create_token")
+def test_get_list_success(client, prefix, svc, token, breadcrumb):
+    """Test GET /api/<domain> for successful response."""
+    with patch.object(svc, f"get_{prefix}s") as mock_get_list:
+        mock_get_list.return_value = {
+            "items": [
+                {"_id": "123", "name": f"{prefix}1"},
+                {"_id": "456", "name": f"{prefix}2"},
+            ],
+            "limit": 10,
+            "has_more": False,
+            "next_cursor": None,
+        }
+
+        response = client.get(f"/api/{prefix}")
+
+    assert response.status_code == 200
+    data = response.json
+    assert isinstance(data, dict)
+    assert "items" in data
+    assert len(data["items"]) == 2
+    mock_get_list.assert_called_once_with(
+        token,
+        breadcrumb,
+        name=None,
+        after_id=None,
+        limit=10,
+        sort_by="name",
+        order="asc",
+    )
+
+
+@crud_cases
+@pytest.mark.usefixtures("mock_create_token")
+def test_get_list_with_name_filter(client, prefix, svc, token, breadcrumb):
+    """Test GET /api/<domain> with name query parameter."""
+    with patch.object(svc, f"get_{prefix}s") as mock_get_list:
+        mock_get_list.return_value = {
+            "items": [{"_id": "123", "name": f"test-{prefix}"}],
+            "limit": 10,
+            "has_more": False,
+            "next_cursor": None,
+        }
+
+        response = client.get(f"/api/{prefix}?name=test")
+
+    assert response.status_code == 200
+    data = response.json
+    assert isinstance(data, dict)
+    assert "items" in data
+    assert len(data["items"]) == 1
+    mock_get_list.assert_called_once_with(
+        token,
+        breadcrumb,
+        name="test",
+        after_id=None,
+        limit=10,
+        sort_by="name",
+        order="asc",
+    )
+
+
+@crud_cases
+@pytest.mark.usefixtures("mock_create_token")
+def test_get_list_empty(client, prefix, svc):
+    """Test GET /api/<domain> returns the infinite scroll shape when empty."""
+    with patch.object(svc, f"get_{prefix}s") as mock_get_list:
+        mock_get_list.return_value = {
+            "items": [],
+            "limit": 10,
+            "has_more": False,
+            "next_cursor": None,
+        }
+
+        response = client.get(f"/api/{prefix}")
+
+    assert response.status_code == 200
+    assert response.json == {
+        "items": [],
+        "limit": 10,
+        "has_more": False,
+        "next_cursor": None,
+    }
+
+
+@crud_cases
+@pytest.mark.usefixtures("mock_create_token")
+def test_get_one_success(client, prefix, svc, token, breadcrumb):
+    """Test GET /api/<domain>/<id> for successful response."""
+    with patch.object(svc, f"get_{prefix}") as mock_get:
+        mock_get.return_value = {"_id": "123", "name": f"{prefix}1"}
+
+        response = client.get(f"/api/{prefix}/123")
+
+    assert response.status_code == 200
+    assert response.json["_id"] == "123"
+    mock_get.assert_called_once_with("123", token, breadcrumb)
+
+
+@crud_cases
+@pytest.mark.usefixtures("mock_create_token")
+def test_get_one_not_found(client, prefix, svc):
+    """Test GET /api/<domain>/<id> when document is not found."""
+    with patch.object(svc, f"get_{prefix}") as mock_get:
+        mock_get.side_effect = HTTPNotFound(f"{prefix} 999 not found")
+
+        response = client.get(f"/api/{prefix}/999")
+
+    assert response.status_code == 404
+    assert response.json["error"] == f"{prefix} 999 not found"
+
+
+@crud_cases
+def test_get_list_unauthorized(client, mock_create_token, prefix, svc):
+    """Test GET /api/<domain> when token is invalid."""
+    mock_create_token.side_effect = HTTPUnauthorized("Invalid token")
+    response = client.get(f"/api/{prefix}")
+
+    assert response.status_code == 401
+    assert "error" in response.json
+
+
+@write_cases
+def test_create_unauthorized(client, mock_create_token, prefix, svc):
+    """Test POST /api/<domain> when token is invalid."""
+    mock_create_token.side_effect = HTTPUnauthorized("Invalid token")
+    response = client.post(f"/api/{prefix}", json={"name": "test"})
+
+    assert response.status_code == 401
+    assert "error" in response.json
\ No newline at end of file
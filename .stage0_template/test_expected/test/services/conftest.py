@@ -0,0 +1,88 @@
+"""
+Shared pytest fixtures for the service unit tests.
+
+A test module opts in to the config and mongo fixtures below by defining
+a ``service_module`` fixture that returns the ``src.services.<domain>_service``
+module under test. Tests then take ``mongo_mock``, the one MongoIO double
+every service test uses: a ``Mock`` of MongoIO whose ``get_collection``
+returns the ``collection`` mock. ``broken_mongo`` is the same mock with one
+method made to raise.
+"""
+from unittest.mock import Mock
+
+import pytest
+from api_utils import Config
+from pymongo.collection import Collection
+
+
+class FakeCursor(list):
+    """List-backed stand-in for a pymongo cursor's fluent sort/limit chain."""
+
+    def sort(self, *args, **kwargs):
+        return self
+
+    def limit(self, *args, **kwargs):
+        return self
+
+
+def _assert_created(args, collection, name, stamps=("created",)):
+    """Assert create_document ``args`` put a document called ``name`` into ``collection``."""
+    created_collection, created_data = args
+    assert created_collection == collection
+    assert created_data["name"] == name
+    assert all(stamp in created_data for stamp in stamps)
+
+
+@pytest.fixture(scope="session")
+def assert_created():
+    """Helper that checks the document a create test sent to MongoIO."""
+    return _assert_created
+
+
+@pytest.fixture(scope="session")
+def fake_cursor():
+    """Cursor class for ``collection.find`` to return, built from a list of documents."""
+    return FakeCursor
+
+
+@pytest.fixture(scope="session")
+def mock_config():
+    """Read-only Config mock carrying every data domain's collection name."""
+    config = Mock(spec=Config)
+    config.CONTROL_COLLECTION_NAME = "Control"
+    config.CREATE_COLLECTION_NAME = "Create"
+    config.CONSUME_COLLECTION_NAME = "Consume"
+    return config
+
+
+@pytest.fixture
+def patched_config(service_module, mock_config, monkeypatch):
+    """Make Config.get_instance return the shared config mock for one test."""
+    monkeypatch.setattr(service_module.Config, "get_instance", lambda: mock_config)
+    return mock_config
+
+
+@pytest.fixture
+def collection():
+    """Collection mock that ``mongo_mock.get_collection`` returns."""
+    return Mock(spec=Collection)
+
+
+@pytest.fixture
+def mongo_mock(service_module, patched_config, collection, monkeypatch):
+    """Make MongoIO.get_instance return a fresh MongoIO mock for one test."""
+    mongo = Mock(spec=service_module.MongoIO)
+    mongo.get_collection.return_value = collection
+    monkeypatch.setattr(service_module.MongoIO, "get_instance", lambda: mongo)
+    return mongo
+
+
+@pytest.fixture
+def broken_mongo(request, mongo_mock):
+    """``mongo_mock`` with its ``request.param`` method raising a database error.
+
+    Use with ``indirect=True`` and parametrise over MongoIO method names.
+    """
+    # A fresh exception per test, so tracebacks do not pile up on a shared one
+    getattr(mongo_mock, request.param).side_effect = Exception("Database error")
+    return mongo_mock
\ No newline at end of file
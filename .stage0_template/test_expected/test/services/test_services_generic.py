@@ -0,0 +1,138 @@
+"""
+Unit tests for the read behaviour every data domain service shares.
+
+Control, Create and Consume services all expose the same get-one and
+get-list operations, so those are tested here once, parametrised over
+every generated service. Domain-specific behaviour (create, update,
+cursor handling) stays in the per-domain test modules.
+"""
+import re
+from types import SimpleNamespace
+from unittest.mock import call
+
+import pytest
+from bson import ObjectId
+from api_utils.flask_utils.exceptions import (
+    HTTPBadRequest,
+    HTTPNotFound,
+    HTTPInternalServerError,
+)
+from src.services import control_service
+from src.services import create_service
+from src.services import consume_service
+
+# (service module, service class name, domain name, collection name)
+SERVICE_CASES = [
+    (control_service, "ControlService", "control", "Control"),
+    (create_service, "CreateService", "create", "Create"),
+    (consume_service, "ConsumeService", "consume", "Consume"),
+]
+
+_DOCUMENT = {"_id": "123", "name": "document1"}
+# Cursor contents, parsed once at import rather than in every test
+_FIRST_BATCH_ITEMS = [
+    {"_id": ObjectId("507f1f77bcf86cd799439011"), "name": "document1"},
+    {"_id": ObjectId("507f1f77bcf86cd799439012"), "name": "document2"},
+]
+
+
+@pytest.fixture(params=SERVICE_CASES, ids=[case[2] for case in SERVICE_CASES])
+def service_case(request):
+    """One entry of SERVICE_CASES."""
+    return request.param
+
+
+@pytest.fixture
+def service_module(service_case):
+    """Service module whose Config and MongoIO lookups are patched."""
+    return service_case[0]
+
+
+@pytest.fixture
+def service_spec(service_case, mongo_mock):
+    """Describe one service's read methods and the MongoIO mock behind them."""
+    module, class_name, name, collection = service_case
+    service = getattr(module, class_name)
+    return SimpleNamespace(
+        get_one=getattr(service, f"get_{name}"),
+        get_list=getattr(service, f"get_{name}s"),
+        collection=collection,
+        mongo=mongo_mock,
+    )
+
+
+def test_get_one_success(service_spec, token, breadcrumb):
+    """Test successful retrieval of a specific document."""
+    service_spec.mongo.get_document.return_value = _DOCUMENT
+
+    result = service_spec.get_one("123", token, breadcrumb)
+
+    assert result == _DOCUMENT
+    get_document = service_spec.mongo.get_document
+    assert get_document.call_count == 1
+    assert get_document.call_args == call(service_spec.collection, "123")
+
+
+def test_get_one_not_found(service_spec, token, breadcrumb):
+    """Test get-one raises HTTPNotFound when the document is not found."""
+    service_spec.mongo.get_document.return_value = None
+
+    with pytest.raises(HTTPNotFound, match="999"):
+        service_spec.get_one("999", token, breadcrumb)
+
+
+def test_get_list_first_batch(
+    service_spec, collection, fake_cursor, token, breadcrumb
+):
+    """Test successful retrieval of first batch (no cursor)."""
+    collection.find.return_value = fake_cursor(_FIRST_BATCH_ITEMS)
+
+    result = service_spec.get_list(token, breadcrumb, limit=10)
+
+    assert "items" in result
+    assert "limit" in result
+    assert "has_more" in result
+    assert "next_cursor" in result
+    assert len(result["items"]) == 2
+    assert result["limit"] == 10
+    assert not result["has_more"]
+    assert result["next_cursor"] is None
+    assert collection.find.call_count == 1
+    assert service_spec.mongo.get_collection.call_args == call(service_spec.collection)
+
+
+@pytest.mark.parametrize(
+    "kwargs,msg",
+    [
+        ({"limit": 0}, "limit must be >= 1"),
+        ({"limit": 101}, "limit must be <= 100"),
+        ({"sort_by": "invalid_field"}, "sort_by must be one of"),
+        ({"order": "invalid"}, "order must be 'asc' or 'desc'"),
+        ({"after_id": "invalid"}, "after_id must be a valid MongoDB ObjectId"),
+    ],
+    ids=[
+        "limit_too_small",
+        "limit_too_large",
+        "invalid_sort_by",
+        "invalid_order",
+        "invalid_after_id",
+    ],
+)
+def test_get_list_invalid_args(service_spec, token, breadcrumb, kwargs, msg):
+    """Test get-list raises HTTPBadRequest for invalid query arguments."""
+    with pytest.raises(HTTPBadRequest, match=re.escape(msg)):
+        service_spec.get_list(token, breadcrumb, **kwargs)
+
+
+@pytest.mark.parametrize("broken_mongo", ["get_collection"], indirect=True)
+def test_get_list_handles_exception(broken_mongo, service_spec, token, breadcrumb):
+    """Test get-list wraps database errors in HTTPInternalServerError."""
+    with pytest.raises(HTTPInternalServerError):
+        service_spec.get_list(token, breadcrumb)
+
+
+@pytest.mark.parametrize("broken_mongo", ["get_document"], indirect=True)
+def test_get_one_handles_exception(broken_mongo, service_spec, token, breadcrumb):
+    """Test get-one wraps database errors in HTTPInternalServerError."""
+    with pytest.raises(HTTPInternalServerError):
+        service_spec.get_one("123", token, breadcrumb)
\ No newline at end of file
@@ -0,0 +1,95 @@
+"""
+In-process API tests for the data domain endpoints.
+
+These drive the real Flask app through its test client, so routing,
+blueprint registration, the services and their JSON responses are
+exercised end to end without a running server. The token helpers are
+patched by the shared ``mock_create_token`` fixture and MongoIO is mocked;
+checks that need a live database stay in the E2E suite.
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+from api_utils import MongoIO
+
+pytestmark = pytest.mark.api
+
+# Url prefixes of every data domain, and of those that expose POST
+DOMAINS = [
+    "control",
+    "create",
+    "consume",
+]
+WRITE_DOMAINS = [
+    "control",
+    "create",
+]
+
+# Valid ObjectId that no test document uses
+MISSING_ID = "000000000000000000000000"
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Test client for the real app, imported with its singletons stubbed."""
+    with (
+        patch("signal.signal"),
+        patch("api_utils.Config.get_instance", return_value=MagicMock()),
+        patch(
+            "api_utils.MongoIO.get_instance",
+            return_value=MagicMock(**{"get_documents.return_value": []}),
+        ),
+    ):
+        from src.server import app
+    return app.test_client()
+
+
+@pytest.fixture
+def mongo(monkeypatch):
+    """MongoIO mock the services get from MongoIO.get_instance for one test.
+
+    Collection queries iterate as empty, whatever cursor chain they build.
+    """
+    mongo = MagicMock(spec=MongoIO)
+    monkeypatch.setattr(MongoIO, "get_instance", lambda: mongo)
+    return mongo
+
+
+@pytest.mark.parametrize("prefix", WRITE_DOMAINS)
+@pytest.mark.usefixtures("mock_create_token")
+def test_create_returns_document(client, mongo, prefix):
+    """Test POST creates a document and returns it with its _id."""
+    mongo.create_document.return_value = "123"
+    mongo.get_document.return_value = {"_id": "123", "name": f"inproc-{prefix}"}
+
+    response = client.post(f"/api/{prefix}", json={"name": f"inproc-{prefix}"})
+
+    assert response.status_code == 201
+    assert response.json == {"_id": "123", "name": f"inproc-{prefix}"}
+    (_, created_data), _ = mongo.create_document.call_args
+    assert created_data["name"] == f"inproc-{prefix}"
+
+
+@pytest.mark.parametrize("prefix", DOMAINS)
+@pytest.mark.usefixtures("mock_create_token")
+def test_list_returns_infinite_scroll_batch(client, mongo, prefix):
+    """Test GET on the collection returns an infinite scroll batch."""
+    response = client.get(f"/api/{prefix}")
+
+    assert response.status_code == 200
+    assert response.json == {
+        "items": [],
+        "limit": 10,
+        "has_more": False,
+        "next_cursor": None,
+    }
+
+
+@pytest.mark.parametrize("prefix", DOMAINS)
+@pytest.mark.usefixtures("mock_create_token")
+def test_get_missing_document_returns_404(client, mongo, prefix):
+    """Test GET by an unknown id returns 404."""
+    mongo.get_document.return_value = None
+
+    response = client.get(f"/api/{prefix}/{MISSING_ID}")
+
+    assert response.status_code == 404
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""
+Shared fixtures for the E2E tests.
+
+Every test in the run reuses one keep-alive HTTP session and one set of
+auth headers instead of opening a fresh connection per request. The bulk
+workflow tests build their batches through ``bulk_batch``.
+"""
+import uuid
+
+import pytest
+
+from .e2e_auth import get_auth_token
+
+# Documents created by each bulk workflow test
+BULK_SIZE = 5
+
+
+class BulkBatch:
+    """BULK_SIZE documents created under one unique name prefix."""
+
+    def __init__(self, http, auth_headers, url):
+        self.http = http
+        self.auth_headers = auth_headers
+        self.url = url
+        self.prefix = f"e2e-bulk-{uuid.uuid4().hex[:8]}"
+        self.ids = [self._create(f"{self.prefix}-{i}") for i in range(BULK_SIZE)]
+
+    def _create(self, name):
+        response = self.http.post(
+            self.url,
+            headers=self.auth_headers,
+            json={"name": name, "description": "E2E bulk document"},
+        )
+        assert response.status_code == 201, response.text[:300]
+        return response.json()["_id"]
+
+    def list_items(self):
+        """List the batch by its name prefix and check exactly its documents came back."""
+        response = self.http.get(
+            self.url,
+            headers=self.auth_headers,
+            params={"name": self.prefix, "limit": BULK_SIZE},
+        )
+        assert response.status_code == 200, response.text[:300]
+        items = response.json()["items"]
+        assert sorted(item["_id"] for item in items) == sorted(self.ids)
+        return items
+
+
+@pytest.fixture(scope="session")
+def http():
+    """Keep-alive HTTP session shared by every E2E test."""
+    # Imported here so unit-only runs never load requests and urllib3
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def auth_headers():
+    """Bearer auth headers for the E2E access token."""
+    return {"Authorization": f"Bearer {get_auth_token()}"}
+
+
+@pytest.fixture
+def bulk_batch(http, auth_headers):
+    """Factory that creates a BulkBatch of documents at the given collection url."""
+
+    def create(url):
+        return BulkBatch(http, auth_headers, url)
+
+    return create
@@ -11,9 +11,8 @@ To run these tests:
 API runs on port {{repo.port}} (same for dev and api).
 """
 import pytest
-import requests
 
-from .e2e_auth import get_auth_token
+pytestmark = pytest.mark.e2e
 
 BASE_URL = "http://localhost:{{repo.port}}"
 
@@ -24,17 +23,14 @@ def _err(response, expected):
     return f"Expected {expected}, got {response.status_code}. Response: {body}"
 
 
-@pytest.mark.e2e
-def test_create_{{item | lower}}_endpoint():
+def test_create_{{item | lower}}_endpoint(http, auth_headers):
     """Test POST /api/{{item | lower}} endpoint and verify record persists in database."""
-    token = get_auth_token()
-    headers = {"Authorization": f"Bearer {token}"}
     data = {
         "name": "e2e-test-{{item | lower}}",
         "description": "E2E test {{item | lower}} document",
     }
 
-    response = requests.post(f"{BASE_URL}/api/{{item | lower}}", headers=headers, json=data)
+    response = http.post(f"{BASE_URL}/api/{{item | lower}}", headers=auth_headers, json=data)
     assert response.status_code == 201, _err(response, 201)
 
     response_data = response.json()
@@ -44,12 +40,27 @@ def test_create_{{item | lower}}_endpoint():
     assert "saved" in response_data
 
 
-@pytest.mark.e2e
-def test_get_{{item | lower}}s_endpoint():
+@pytest.mark.e2e_bulk
+def test_{{item | lower}}_bulk_workflow(http, auth_headers, bulk_batch):
+    """Create, update and list a batch of {{item | lower}} documents over one keep-alive session."""
+    url = f"{BASE_URL}/api/{{item | lower}}"
+    batch = bulk_batch(url)
+
+    for document_id in batch.ids:
+        response = http.patch(
+            f"{url}/{document_id}",
+            headers=auth_headers,
+            json={"description": "E2E bulk update"},
+        )
+        assert response.status_code == 200, _err(response, 200)
+
+    items = batch.list_items()
+    assert all(item["description"] == "E2E bulk update" for item in items)
+
+
+def test_get_{{item | lower}}s_endpoint(http, auth_headers):
     """Test GET /api/{{item | lower}} endpoint."""
-    token = get_auth_token()
-    headers = {"Authorization": f"Bearer {token}"}
-    response = requests.get(f"{BASE_URL}/api/{{item | lower}}", headers=headers)
+    response = http.get(f"{BASE_URL}/api/{{item | lower}}", headers=auth_headers)
     assert response.status_code == 200, _err(response, 200)
 
     response_data = response.json()
@@ -61,12 +72,9 @@ def test_get_{{item | lower}}s_endpoint():
     assert isinstance(response_data["items"], list), "Items should be a list"
 
 
-@pytest.mark.e2e
-def test_get_{{item | lower}}s_with_name_filter():
+def test_get_{{item | lower}}s_with_name_filter(http, auth_headers):
     """Test GET /api/{{item | lower}} with name query parameter."""
-    token = get_auth_token()
-    headers = {"Authorization": f"Bearer {token}"}
-    response = requests.get(f"{BASE_URL}/api/{{item | lower}}?name=e2e", headers=headers)
+    response = http.get(f"{BASE_URL}/api/{{item | lower}}?name=e2e", headers=auth_headers)
     assert response.status_code == 200, _err(response, 200)
 
     response_data = response.json()
@@ -75,9 +83,8 @@ def test_get_{{item | lower}}s_with_name_filter():
     assert isinstance(response_data["items"], list), "Items should be a list"
 
 
-@pytest.mark.e2e
-def test_{{item | lower}}_endpoints_require_auth():
+def test_{{item | lower}}_endpoints_require_auth(http):
     """Test that {{item | lower}} endpoints require authentication."""
-    response = requests.get(f"{BASE_URL}/api/{{item | lower}}")
+    response = http.get(f"{BASE_URL}/api/{{item | lower}}")
     assert response.status_code == 401, f"Expected 401, got {response.status_code}"
 
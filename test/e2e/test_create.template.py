@@ -11,9 +11,8 @@ To run these tests:
 API runs on port {{repo.port}} (same for dev and api).
 """
 import pytest
-import requests
 
-from .e2e_auth import get_auth_token
+pytestmark = pytest.mark.e2e
 
 BASE_URL = "http://localhost:{{repo.port}}"
 
@@ -24,17 +23,14 @@ def _err(response, expected):
     return f"Expected {expected}, got {response.status_code}. Response: {body}"
 
 
-@pytest.mark.e2e
-def test_create_{{item | lower}}_endpoint():
+def test_create_{{item | lower}}_endpoint(http, auth_headers):
     """Test POST /api/{{item | lower}} endpoint and basic retrieval by ID and search."""
-    token = get_auth_token()
-    headers = {"Authorization": f"Bearer {token}"}
     data = {
         "name": "e2e-test-{{item | lower}}",
         "description": "E2E test {{item | lower}} document",
     }
 
-    response = requests.post(f"{BASE_URL}/api/{{item | lower}}", headers=headers, json=data)
+    response = http.post(f"{BASE_URL}/api/{{item | lower}}", headers=auth_headers, json=data)
     assert response.status_code == 201, _err(response, 201)
 
     response_data = response.json()
@@ -43,12 +39,15 @@ def test_create_{{item | lower}}_endpoint():
     assert "created" in response_data
 
 
-@pytest.mark.e2e
-def test_get_{{item | lower}}s_endpoint():
+@pytest.mark.e2e_bulk
+def test_{{item | lower}}_bulk_workflow(bulk_batch):
+    """Create and list a batch of {{item | lower}} documents over one keep-alive session."""
+    bulk_batch(f"{BASE_URL}/api/{{item | lower}}").list_items()
+
+
+def test_get_{{item | lower}}s_endpoint(http, auth_headers):
     """Test GET /api/{{item | lower}} endpoint."""
-    token = get_auth_token()
-    headers = {"Authorization": f"Bearer {token}"}
-    response = requests.get(f"{BASE_URL}/api/{{item | lower}}", headers=headers)
+    response = http.get(f"{BASE_URL}/api/{{item | lower}}", headers=auth_headers)
     assert response.status_code == 200, _err(response, 200)
 
     response_data = response.json()
@@ -60,21 +59,17 @@ def test_get_{{item | lower}}s_endpoint():
     assert isinstance(response_data["items"], list), "Items should be a list"
 
 
-@pytest.mark.e2e
-def test_get_{{item | lower}}_not_found():
+def test_get_{{item | lower}}_not_found(http, auth_headers):
     """Test GET /api/{{item | lower}}/<id> with non-existent ID."""
-    token = get_auth_token()
-    headers = {"Authorization": f"Bearer {token}"}
-    response = requests.get(
+    response = http.get(
         f"{BASE_URL}/api/{{item | lower}}/000000000000000000000000",
-        headers=headers,
+        headers=auth_headers,
     )
     assert response.status_code == 404, _err(response, 404)
 
 
-@pytest.mark.e2e
-def test_{{item | lower}}_endpoints_require_auth():
+def test_{{item | lower}}_endpoints_require_auth(http):
     """Test that {{item | lower}} endpoints require authentication."""
-    response = requests.get(f"{BASE_URL}/api/{{item | lower}}")
+    response = http.get(f"{BASE_URL}/api/{{item | lower}}")
     assert response.status_code == 401, f"Expected 401, got {response.status_code}"
 
@@ -4,29 +4,39 @@ Unit tests for server.py module.
 Tests application initialization, route registration, and configuration.
 """
 import unittest
-from unittest.mock import patch, MagicMock, call
+from unittest.mock import patch, MagicMock
 import signal
-import sys
 
 
+def import_server():
+    """Import src.server with its Config/MongoIO start-up and signal registration patched.
+
+    Test classes call this from setUpClass so the module is never first
+    imported against real singletons, whatever order the classes run in.
+    """
+    with patch('api_utils.Config.get_instance'), \
+            patch('api_utils.MongoIO.get_instance') as mock_get_mongo, \
+            patch('signal.signal'):
+        mock_get_mongo.return_value.get_documents.return_value = []
+        import src.server as server_module
+    return server_module
+
+
+@patch('src.server.signal.signal', autospec=True)
+@patch('api_utils.MongoIO.get_instance', autospec=True)
+@patch('api_utils.Config.get_instance', autospec=True)
 class TestServerInitialization(unittest.TestCase):
     """Test cases for server initialization."""
     
-    @patch('src.server.signal.signal')
-    @patch('api_utils.MongoIO.get_instance')
-    @patch('api_utils.Config.get_instance')
     def test_config_singleton_initialized(self, mock_get_config, mock_get_mongo, mock_signal):
         """Test that Config singleton is properly initialized."""
         # Arrange
-        mock_config = MagicMock()
-        mock_config.ENUMERATORS_COLLECTION_NAME = "Enumerators"
-        mock_config.VERSIONS_COLLECTION_NAME = "Versions"
-        mock_config.{{ (repo.name | upper | replace("-", "_")) }}_PORT = 8184
-        mock_get_config.return_value = mock_config
-        
-        mock_mongo_instance = MagicMock()
-        mock_mongo_instance.get_documents.return_value = []
-        mock_get_mongo.return_value = mock_mongo_instance
+        mock_get_config.return_value = MagicMock(
+            ENUMERATORS_COLLECTION_NAME="Enumerators",
+            VERSIONS_COLLECTION_NAME="Versions",
+            {{ (repo.name | upper | replace("-", "_")) }}_PORT=8184,
+        )
+        mock_get_mongo.return_value = MagicMock(**{"get_documents.return_value": []})
         
         # Import causes initialization
         import importlib
@@ -36,19 +46,14 @@ class TestServerInitialization(unittest.TestCase):
         # Assert
         mock_get_config.assert_called()
     
-    @patch('src.server.signal.signal')
-    @patch('api_utils.MongoIO.get_instance')
-    @patch('api_utils.Config.get_instance')
     def test_mongo_singleton_initialized(self, mock_get_config, mock_get_mongo, mock_signal):
         """Test that MongoIO singleton is properly initialized."""
         # Arrange
-        mock_config = MagicMock()
-        mock_config.ENUMERATORS_COLLECTION_NAME = "Enumerators"
-        mock_config.VERSIONS_COLLECTION_NAME = "Versions"
-        mock_get_config.return_value = mock_config
-        
-        mock_mongo_instance = MagicMock()
-        mock_mongo_instance.get_documents.return_value = []
+        mock_get_config.return_value = MagicMock(
+            ENUMERATORS_COLLECTION_NAME="Enumerators",
+            VERSIONS_COLLECTION_NAME="Versions",
+        )
+        mock_mongo_instance = MagicMock(**{"get_documents.return_value": []})
         mock_get_mongo.return_value = mock_mongo_instance
         
         # Import causes initialization
@@ -64,12 +69,14 @@ class TestServerInitialization(unittest.TestCase):
 class TestAppConfiguration(unittest.TestCase):
     """Test cases for Flask app configuration."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Import the app once with the start-up singletons patched."""
+        cls.app = import_server().app
+    
     def setUp(self):
         """Set up test fixtures."""
-        # Import the app after mocking at module level is complete
-        from src.server import app
-        self.app = app
-        self.client = app.test_client()
+        self.client = self.app.test_client()
     
     def test_app_exists(self):
         """Test that Flask app is created."""
@@ -153,23 +160,20 @@ class TestAppConfiguration(unittest.TestCase):
         self.assertTrue(any('/metrics' in rule for rule in rules))
 
 
+@patch('src.server.signal.signal', autospec=True)
+@patch('api_utils.MongoIO.get_instance', autospec=True)
+@patch('api_utils.Config.get_instance', autospec=True)
 class TestSignalHandlers(unittest.TestCase):
-    """Test cases for signal handler registration and behavior."""
+    """Test cases for signal handler registration."""
     
-    @patch('src.server.signal.signal')
-    @patch('api_utils.MongoIO.get_instance')
-    @patch('api_utils.Config.get_instance')
     def test_sigterm_handler_registered(self, mock_get_config, mock_get_mongo, mock_signal):
         """Test that SIGTERM handler is registered."""
         # Arrange
-        mock_config = MagicMock()
-        mock_config.ENUMERATORS_COLLECTION_NAME = "Enumerators"
-        mock_config.VERSIONS_COLLECTION_NAME = "Versions"
-        mock_get_config.return_value = mock_config
-        
-        mock_mongo_instance = MagicMock()
-        mock_mongo_instance.get_documents.return_value = []
-        mock_get_mongo.return_value = mock_mongo_instance
+        mock_get_config.return_value = MagicMock(
+            ENUMERATORS_COLLECTION_NAME="Enumerators",
+            VERSIONS_COLLECTION_NAME="Versions",
+        )
+        mock_get_mongo.return_value = MagicMock(**{"get_documents.return_value": []})
         
         # Import causes signal registration
         import importlib
@@ -184,20 +188,14 @@ class TestSignalHandlers(unittest.TestCase):
         )
         self.assertTrue(sigterm_registered, "SIGTERM handler not registered")
     
-    @patch('src.server.signal.signal')
-    @patch('api_utils.MongoIO.get_instance')
-    @patch('api_utils.Config.get_instance')
     def test_sigint_handler_registered(self, mock_get_config, mock_get_mongo, mock_signal):
         """Test that SIGINT handler is registered."""
         # Arrange
-        mock_config = MagicMock()
-        mock_config.ENUMERATORS_COLLECTION_NAME = "Enumerators"
-        mock_config.VERSIONS_COLLECTION_NAME = "Versions"
-        mock_get_config.return_value = mock_config
-        
-        mock_mongo_instance = MagicMock()
-        mock_mongo_instance.get_documents.return_value = []
-        mock_get_mongo.return_value = mock_mongo_instance
+        mock_get_config.return_value = MagicMock(
+            ENUMERATORS_COLLECTION_NAME="Enumerators",
+            VERSIONS_COLLECTION_NAME="Versions",
+        )
+        mock_get_mongo.return_value = MagicMock(**{"get_documents.return_value": []})
         
         # Import causes signal registration
         import importlib
@@ -211,6 +209,15 @@ class TestSignalHandlers(unittest.TestCase):
             for call_args in calls
         )
         self.assertTrue(sigint_registered, "SIGINT handler not registered")
+
+
+class TestHandleExit(unittest.TestCase):
+    """Test cases for the shutdown signal handler."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Import src.server with the start-up singletons patched."""
+        import_server()
     
     @patch('src.server.sys.exit')
     @patch('src.server.mongo')
@@ -268,6 +275,11 @@ class TestSignalHandlers(unittest.TestCase):
 class TestServerExecution(unittest.TestCase):
     """Test cases for server execution."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Import src.server with the start-up singletons patched."""
+        import_server()
+    
     @patch('src.server.app.run')
     @patch('src.server.config')
     def test_main_execution_uses_config_port(self, mock_config, mock_run):
@@ -284,7 +296,3 @@ class TestServerExecution(unittest.TestCase):
             
             # Assert
             self.assertEqual(api_port, 9999)
-
-
-if __name__ == '__main__':
-    unittest.main()